@@ -1,4 +1,5 @@
 """Provide the ListingGenerator class."""
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from typing import Any, Dict, Iterator, Optional, TypeVar
 
@@ -24,6 +25,8 @@ class ListingGenerator(PRAWBase):
         url: str,
         limit: int = 100,
         params: Optional[Dict[str, str]] = None,
+        prefetch: bool = False,
+        cache_ttl: Optional[float] = None,
     ):
         """Initialize a ListingGenerator instance.
 
@@ -36,15 +39,27 @@ class ListingGenerator(PRAWBase):
             requests (default: 100).
         :param params: A dictionary containing additional query string
             parameters to send with the request.
+        :param prefetch: When True, fetch the next batch of the listing in a
+            background thread while the current batch is consumed, hiding the
+            network latency of pagination (default: False). The prefetched
+            request may be wasted if iteration stops early.
+        :param cache_ttl: When set, serve pages from the Reddit instance's
+            short-lived GET cache for this many seconds rather than
+            re-requesting them, e.g., when the same listing is walked
+            repeatedly in a short window (default: None).
 
         """
         super().__init__(reddit, _data=None)
+        self.cache_ttl = cache_ttl
         self._exhausted = False
         self._listing = None
         self._list_index = None
+        self._prefetch_executor = None
+        self._prefetched_batch = None
         self.limit = limit
         self.params = deepcopy(params) if params else {}
         self.params["limit"] = limit or 1024
+        self.prefetch = prefetch
         self.url = url
         self.yielded = 0
 
@@ -68,7 +83,11 @@ class ListingGenerator(PRAWBase):
         if self._exhausted:
             raise StopIteration()
 
-        self._listing = self._reddit.get(self.url, params=self.params)
+        if self._prefetched_batch is not None:
+            self._listing = self._prefetched_batch.result()
+            self._prefetched_batch = None
+        else:
+            self._listing = self._fetch_page(self.params)
         if isinstance(self._listing, list):
             self._listing = self._listing[1]  # for submission duplicates
         elif isinstance(self._listing, dict):
@@ -82,5 +101,28 @@ class ListingGenerator(PRAWBase):
             "after"
         ):
             self.params["after"] = self._listing.after
+            if self.prefetch:
+                self._prefetch_next_batch()
         else:
             self._exhausted = True
+            if self._prefetch_executor is not None:
+                self._prefetch_executor.shutdown(wait=False)
+
+    def _fetch_page(self, params):
+        if self.cache_ttl is not None:
+            return self._reddit._get_cached(
+                self.url, params=params, ttl=self.cache_ttl
+            )
+        return self._reddit.get(self.url, params=params)
+
+    def _prefetch_next_batch(self):
+        remaining = None if self.limit is None else self.limit - self.yielded
+        if remaining is not None and remaining <= len(self._listing):
+            return
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(max_workers=1)
+        # Pass a copy of the params so that the background request is
+        # unaffected by subsequent mutation of ``self.params``.
+        self._prefetched_batch = self._prefetch_executor.submit(
+            self._fetch_page, dict(self.params)
+        )
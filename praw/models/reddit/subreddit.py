@@ -31,6 +31,10 @@ from .removal_reasons import SubredditRemovalReasons
 from .widgets import SubredditWidgets, WidgetEncoder
 from .wikipage import WikiPage
 
+# Map bool(selftext is not None) to the submission kind and the data field
+# holding the submission's content.
+_SUBMIT_KIND = {True: ("self", "text"), False: ("link", "url")}
+
 
 class Subreddit(
     MessageableMixin, SubredditListingMixin, FullnameMixin, RedditBase
@@ -834,6 +838,7 @@ class Subreddit(
         if (bool(selftext) or selftext == "") == bool(url):
             raise TypeError("Either `selftext` or `url` must be provided.")
 
+        kind, content_field = _SUBMIT_KIND[selftext is not None]
         data = {
             "sr": str(self),
             "resubmit": bool(resubmit),
@@ -842,6 +847,8 @@ class Subreddit(
             "nsfw": bool(nsfw),
             "spoiler": bool(spoiler),
             "validate_on_submit": self._reddit.validate_on_submit,
+            "kind": kind,
+            content_field: selftext if selftext is not None else url,
         }
         for key, value in (
             ("flair_id", flair_id),
@@ -851,10 +858,6 @@ class Subreddit(
         ):
             if value is not None:
                 data[key] = value
-        if selftext is not None:
-            data.update(kind="self", text=selftext)
-        else:
-            data.update(kind="link", url=url)
 
         return self._reddit.post(API_PATH["submit"], data=data)
 
@@ -1270,9 +1273,8 @@ class SubredditFlair:
             generator_kwargs, "params", name=redditor
         )
         generator_kwargs.setdefault("limit", None)
-        url = API_PATH["flairlist"].format(subreddit=self.subreddit)
         return ListingGenerator(
-            self.subreddit._reddit, url, **generator_kwargs
+            self.subreddit._reddit, self._flairlist_url, **generator_kwargs
         )
 
     def __init__(self, subreddit):
@@ -1282,6 +1284,10 @@ class SubredditFlair:
 
         """
         self.subreddit = subreddit
+        self._subreddit_str = str(subreddit)
+        self._flairlist_url = API_PATH["flairlist"].format(
+            subreddit=self._subreddit_str
+        )
 
     def configure(
         self,
@@ -1314,7 +1320,7 @@ class SubredditFlair:
             "link_flair_self_assign_enabled": link_self_assign,
         }
         data.update(settings)
-        url = API_PATH["flairconfig"].format(subreddit=self.subreddit)
+        url = API_PATH["flairconfig"].format(subreddit=self._subreddit_str)
         self.subreddit._reddit.post(url, data=data)
 
     def delete(self, redditor):
@@ -1327,7 +1333,7 @@ class SubredditFlair:
                   :meth:`~praw.models.reddit.subreddit.SubredditFlair.update`.
 
         """
-        url = API_PATH["deleteflair"].format(subreddit=self.subreddit)
+        url = API_PATH["deleteflair"].format(subreddit=self._subreddit_str)
         self.subreddit._reddit.post(url, data={"name": str(redditor)})
 
     def delete_all(self):
@@ -1373,10 +1379,12 @@ class SubredditFlair:
         data = {"name": str(redditor), "text": text}
         if flair_template_id is not None:
             data["flair_template_id"] = flair_template_id
-            url = API_PATH["select_flair"].format(subreddit=self.subreddit)
+            url = API_PATH["select_flair"].format(
+                subreddit=self._subreddit_str
+            )
         else:
             data["css_class"] = css_class
-            url = API_PATH["flair"].format(subreddit=self.subreddit)
+            url = API_PATH["flair"].format(subreddit=self._subreddit_str)
         self.subreddit._reddit.post(url, data=data)
 
     def update(self, flair_list, text="", css_class=""):
@@ -1420,7 +1428,7 @@ class SubredditFlair:
             lines.append('"{}","{}","{}"'.format(*fmt_data))
 
         response = []
-        url = API_PATH["flaircsv"].format(subreddit=self.subreddit)
+        url = API_PATH["flaircsv"].format(subreddit=self._subreddit_str)
         while lines:
             data = {"flair_csv": "\n".join(lines[:100])}
             response.extend(self.subreddit._reddit.post(url, data=data))
@@ -1755,6 +1763,22 @@ class SubredditModeration:
 
     """
 
+    @staticmethod
+    def _chunk_fullnames(things, chunk_size=100):
+        """Yield comma-joined fullnames, ``chunk_size`` things at a time.
+
+        Each item in ``things`` should be either a fullname string (e.g.,
+        ``'t3_1234'``), or a :class:`.Comment` or :class:`.Submission`
+        instance.
+
+        """
+        fullnames = [
+            thing if isinstance(thing, str) else thing.fullname
+            for thing in things
+        ]
+        for position in range(0, len(fullnames), chunk_size):
+            yield ",".join(fullnames[position : position + chunk_size])
+
     @staticmethod
     def _handle_only(only, generator_kwargs):
         if only is not None:
@@ -1771,13 +1795,66 @@ class SubredditModeration:
 
         """
         self.subreddit = subreddit
-        self._stream = None
 
     def accept_invite(self):
         """Accept an invitation as a moderator of the community."""
         url = API_PATH["accept_mod_invite"].format(subreddit=self.subreddit)
         self.subreddit._reddit.post(url)
 
+    def bulk_approve(self, things):
+        """Approve many things using batched requests.
+
+        :param things: An iterable of fullname strings (e.g., ``'t3_1234'``),
+            :class:`.Comment` instances, or :class:`.Submission` instances.
+
+        The endpoint accepts multiple comma-separated fullnames, so the items
+        are coalesced into one request per 100 things rather than one request
+        each, which is significantly faster for bulk workflows.
+
+        For example, to approve everything in the modqueue of ``r/test``:
+
+        .. code-block:: python
+
+           subreddit = reddit.subreddit('test')
+           subreddit.mod.bulk_approve(subreddit.mod.modqueue(limit=None))
+
+        See also :meth:`.ThingModerationMixin.approve` for approving a single
+        item.
+
+        """
+        for id_chunk in self._chunk_fullnames(things):
+            self.subreddit._reddit.post(
+                API_PATH["approve"], data={"id": id_chunk}
+            )
+
+    def bulk_remove(self, things, spam=False):
+        """Remove many things using batched requests.
+
+        :param things: An iterable of fullname strings (e.g., ``'t3_1234'``),
+            :class:`.Comment` instances, or :class:`.Submission` instances.
+        :param spam: When True, use the removals to help train the Subreddit's
+            spam filter (default: False).
+
+        The endpoint accepts multiple comma-separated fullnames, so the items
+        are coalesced into one request per 100 things rather than one request
+        each, which is significantly faster for bulk workflows.
+
+        For example, to remove everything in the spam queue of ``r/test``:
+
+        .. code-block:: python
+
+           subreddit = reddit.subreddit('test')
+           subreddit.mod.bulk_remove(subreddit.mod.spam(limit=None), spam=True)
+
+        See also :meth:`.ThingModerationMixin.remove` for removing a single
+        item, optionally with a removal reason.
+
+        """
+        for id_chunk in self._chunk_fullnames(things):
+            self.subreddit._reddit.post(
+                API_PATH["remove"], data={"id": id_chunk, "spam": bool(spam)}
+            )
+
     def edited(self, only=None, **generator_kwargs):
         """Return a :class:`.ListingGenerator` for edited comments and submissions.
 
@@ -1877,7 +1954,7 @@ class SubredditModeration:
             **generator_kwargs
         )
 
-    @property
+    @cachedproperty
     def stream(self):
         """Provide an instance of :class:`.SubredditModerationStream`.
 
@@ -1890,9 +1967,7 @@ class SubredditModeration:
                print("Mod: {}, Subreddit: {}".format(log.mod, log.subreddit))
 
         """
-        if self._stream is None:
-            self._stream = SubredditModerationStream(self.subreddit)
-        return self._stream
+        return SubredditModerationStream(self.subreddit)
 
     @cachedproperty
     def removal_reasons(self):
@@ -1973,6 +2048,41 @@ class SubredditModeration:
             **generator_kwargs
         )
 
+    def submit_async(self, method_name, thing, **kwargs):
+        """Invoke a moderation method on ``thing`` in a background thread.
+
+        :param method_name: The name of a method provided by ``thing.mod``,
+            e.g., ``'approve'``, ``'remove'``, ``'distinguish'``, or
+            ``'ignore_reports'``.
+        :param thing: A :class:`.Comment` or :class:`.Submission` instance.
+        :returns: A :class:`concurrent.futures.Future` for the call.
+
+        Keyword arguments are passed through to the invoked method.
+
+        Moderation actions are network-bound, so dispatching independent
+        actions through the shared thread pool lets their requests overlap on
+        the keep-alive connection pool instead of blocking one round-trip at
+        a time. Order-dependent sequences of actions should continue to use
+        the synchronous methods.
+
+        For example, to approve everything in the modqueue of ``r/test``
+        concurrently:
+
+        .. code-block:: python
+
+           from concurrent.futures import as_completed
+
+           subreddit = reddit.subreddit('test')
+           futures = [subreddit.mod.submit_async('approve', item)
+                      for item in subreddit.mod.modqueue()]
+           for future in as_completed(futures):
+               future.result()
+
+        """
+        return self.subreddit._reddit._action_executor.submit(
+            getattr(thing.mod, method_name), **kwargs
+        )
+
     def unmoderated(self, **generator_kwargs):
         """Return a :class:`.ListingGenerator` for unmoderated submissions.
 
@@ -2409,11 +2519,8 @@ class SubredditRelationship:
         Subreddit._safely_add_arguments(
             generator_kwargs, "params", user=redditor
         )
-        url = API_PATH["list_{}".format(self.relationship)].format(
-            subreddit=self.subreddit
-        )
         return ListingGenerator(
-            self.subreddit._reddit, url, **generator_kwargs
+            self.subreddit._reddit, self._list_url, **generator_kwargs
         )
 
     def __init__(self, subreddit, relationship):
@@ -2425,6 +2532,10 @@ class SubredditRelationship:
         """
         self.relationship = relationship
         self.subreddit = subreddit
+        self._subreddit_str = str(subreddit)
+        self._list_url = API_PATH["list_{}".format(relationship)].format(
+            subreddit=self._subreddit_str
+        )
 
     def add(self, redditor, **other_settings):
         """Add ``redditor`` to this relationship.
@@ -2435,7 +2546,7 @@ class SubredditRelationship:
         """
         data = {"name": str(redditor), "type": self.relationship}
         data.update(other_settings)
-        url = API_PATH["friend"].format(subreddit=self.subreddit)
+        url = API_PATH["friend"].format(subreddit=self._subreddit_str)
         self.subreddit._reddit.post(url, data=data)
 
     def remove(self, redditor):
@@ -2446,7 +2557,7 @@ class SubredditRelationship:
 
         """
         data = {"name": str(redditor), "type": self.relationship}
-        url = API_PATH["unfriend"].format(subreddit=self.subreddit)
+        url = API_PATH["unfriend"].format(subreddit=self._subreddit_str)
         self.subreddit._reddit.post(url, data=data)
 
 
@@ -2521,10 +2632,7 @@ class ModeratorRelationship(SubredditRelationship):
 
         """
         params = {} if redditor is None else {"user": redditor}
-        url = API_PATH["list_{}".format(self.relationship)].format(
-            subreddit=self.subreddit
-        )
-        return self.subreddit._reddit.get(url, params=params)
+        return self.subreddit._reddit.get(self._list_url, params=params)
 
     # pylint: disable=arguments-differ
     def add(self, redditor, permissions=None, **other_settings):
@@ -2573,7 +2681,7 @@ class ModeratorRelationship(SubredditRelationship):
         """
         data = self._handle_permissions(permissions, other_settings)
         data.update({"name": str(redditor), "type": "moderator_invite"})
-        url = API_PATH["friend"].format(subreddit=self.subreddit)
+        url = API_PATH["friend"].format(subreddit=self._subreddit_str)
         self.subreddit._reddit.post(url, data=data)
 
     def leave(self):
@@ -2602,7 +2710,7 @@ class ModeratorRelationship(SubredditRelationship):
 
         """
         data = {"name": str(redditor), "type": "moderator_invite"}
-        url = API_PATH["unfriend"].format(subreddit=self.subreddit)
+        url = API_PATH["unfriend"].format(subreddit=self._subreddit_str)
         self.subreddit._reddit.post(url, data=data)
 
     def update(self, redditor, permissions=None):
@@ -2628,7 +2736,7 @@ class ModeratorRelationship(SubredditRelationship):
            subreddit.moderator.update('spez', [])
 
         """
-        url = API_PATH["setpermissions"].format(subreddit=self.subreddit)
+        url = API_PATH["setpermissions"].format(subreddit=self._subreddit_str)
         data = self._handle_permissions(
             permissions, {"name": str(redditor), "type": "moderator"}
         )
@@ -2652,7 +2760,7 @@ class ModeratorRelationship(SubredditRelationship):
            subreddit.moderator.update_invite('spez', ['flair', 'mail'])
 
         """
-        url = API_PATH["setpermissions"].format(subreddit=self.subreddit)
+        url = API_PATH["setpermissions"].format(subreddit=self._subreddit_str)
         data = self._handle_permissions(
             permissions, {"name": str(redditor), "type": "moderator_invite"}
         )
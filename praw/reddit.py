@@ -1,6 +1,7 @@
 """Provide the Reddit class."""
 import configparser
 import os
+from concurrent.futures import ThreadPoolExecutor
 from itertools import islice
 from typing import IO, Any, Dict, Generator, Iterable, Optional, Type, Union
 from warnings import warn
@@ -17,6 +18,7 @@ from prawcore import (
     session,
 )
 from prawcore.exceptions import BadRequest
+from requests.adapters import HTTPAdapter
 
 from . import models
 from .config import Config
@@ -27,6 +29,7 @@ from .exceptions import (
     RedditAPIException,
 )
 from .objector import Objector
+from .util.cache import TTLCache, cachedproperty
 
 try:
     from update_checker import update_check
@@ -41,6 +44,10 @@ Redditor = models.Redditor
 Submission = models.Submission
 Subreddit = models.Subreddit
 
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 16
+WORKER_THREADS = 8
+
 
 class Reddit:
     """The Reddit class provides convenient access to Reddit's API.
@@ -60,6 +67,17 @@ class Reddit:
 
     update_checked = False
 
+    @cachedproperty
+    def _action_executor(self):
+        """Provide a bounded thread pool for concurrent API actions.
+
+        The pool is created on first use and shared by all helpers bound to
+        this instance. Its size stays below the session's connection pool so
+        each worker can hold a pooled keep-alive connection.
+
+        """
+        return ThreadPoolExecutor(max_workers=WORKER_THREADS)
+
     @property
     def _next_unique(self):
         value = self._unique_counter
@@ -173,6 +191,7 @@ class Reddit:
 
         """
         self._core = self._authorized_core = self._read_only_core = None
+        self._get_cache = TTLCache()
         self._objector = None
         self._unique_counter = 0
         self._validate_on_submit = False
@@ -407,6 +426,20 @@ class Reddit:
             **requestor_kwargs
         )
 
+        if "session" not in requestor_kwargs:
+            # The requestor's session persists for the lifetime of this
+            # instance, so keep-alive connections established by an enlarged
+            # pool are reused across requests rather than paying the TCP and
+            # TLS setup cost on each call. Retries are left to prawcore, which
+            # already implements its own retry strategy.
+            requestor._http.mount(
+                "https://",
+                HTTPAdapter(
+                    pool_connections=POOL_CONNECTIONS,
+                    pool_maxsize=POOL_MAXSIZE,
+                ),
+            )
+
         if self.config.client_secret:
             self._prepare_trusted_prawcore(requestor)
         else:
@@ -484,6 +517,32 @@ class Reddit:
         data = self.request("GET", path, params=params)
         return self._objector.objectify(data)
 
+    def _get_cached(
+        self,
+        path: str,
+        params: Optional[Dict[str, str]] = None,
+        ttl: float = 30,
+    ):
+        """Return possibly cached objects from a GET request to ``path``.
+
+        :param path: The path to fetch.
+        :param params: The query parameters to add to the request (default:
+            None).
+        :param ttl: The number of seconds for which the response may be
+            served from the cache (default: 30).
+
+        Identical requests made within ``ttl`` seconds are served from an
+        in-process cache and return the same objects, so this should only be
+        used for read-only paths where slightly stale data is acceptable.
+
+        """
+        key = (path, frozenset((params or {}).items()))
+        value = self._get_cache.get(key)
+        if value is None:
+            value = self.get(path, params=params)
+            self._get_cache.set(key, value, ttl)
+        return value
+
     def info(
         self,
         fullnames: Optional[Iterable[str]] = None,
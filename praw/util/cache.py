@@ -1,7 +1,49 @@
 """Caching utilities."""
+from time import time
 from typing import Any, Callable, Optional
 
 
+class TTLCache:
+    """A mapping whose entries expire after a fixed time-to-live.
+
+    Entries are evicted lazily on access once their time-to-live has
+    elapsed. When the cache is full, the oldest entry is discarded to make
+    room for new ones.
+
+    This is intentionally minimal; it exists so that read-only responses can
+    be cached for short windows without adding a dependency.
+
+    .. versionadded:: 7.0.0
+    """
+
+    def __init__(self, maxsize: int = 512):
+        """Initialize the cache.
+
+        :param maxsize: The maximum number of entries to retain
+            (default: 512).
+
+        """
+        self._maxsize = maxsize
+        self._store = {}
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Return the unexpired value for ``key``, or ``None``."""
+        try:
+            expires_at, value = self._store[key]
+        except KeyError:
+            return None
+        if time() >= expires_at:
+            del self._store[key]
+            return None
+        return value
+
+    def set(self, key: Any, value: Any, ttl: float):
+        """Store ``value`` for ``key`` for ``ttl`` seconds."""
+        if key not in self._store and len(self._store) >= self._maxsize:
+            del self._store[next(iter(self._store))]
+        self._store[key] = (time() + ttl, value)
+
+
 class cachedproperty:
     """A decorator for caching a property's result.
 
@@ -4,6 +4,26 @@ from praw.models.listing.generator import ListingGenerator
 from ... import UnitTest
 
 
+class _FakeObjector:
+    @staticmethod
+    def objectify(data):
+        return data
+
+
+class _FakeReddit:
+    """Serve canned listing pages in place of network requests."""
+
+    _objector = _FakeObjector()
+
+    def __init__(self, pages):
+        self._pages = iter(pages)
+        self.params_seen = []
+
+    def get(self, url, params=None):
+        self.params_seen.append(dict(params))
+        return next(self._pages)
+
+
 class TestListingGenerator(UnitTest):
     def test_params_are_not_modified(self):
         params = {"prawtest": "yes"}
@@ -11,3 +31,34 @@ class TestListingGenerator(UnitTest):
         assert "limit" in generator.params
         assert "limit" not in params
         assert ("prawtest", "yes") in generator.params.items()
+
+    def test_pagination(self):
+        reddit = _FakeReddit(
+            [{"users": ["a", "b"], "next": "page2"}, {"users": ["c", "d"]}]
+        )
+        generator = ListingGenerator(reddit, "dummy", limit=None)
+        assert list(generator) == ["a", "b", "c", "d"]
+        assert len(reddit.params_seen) == 2
+        assert reddit.params_seen[1]["after"] == "page2"
+
+    def test_pagination__prefetch(self):
+        reddit = _FakeReddit(
+            [
+                {"users": ["a", "b"], "next": "page2"},
+                {"users": ["c", "d"], "next": "page3"},
+                {"users": ["e"]},
+            ]
+        )
+        generator = ListingGenerator(
+            reddit, "dummy", limit=None, prefetch=True
+        )
+        assert list(generator) == ["a", "b", "c", "d", "e"]
+        assert len(reddit.params_seen) == 3
+        assert reddit.params_seen[1]["after"] == "page2"
+        assert reddit.params_seen[2]["after"] == "page3"
+
+    def test_pagination__prefetch_respects_limit(self):
+        reddit = _FakeReddit([{"users": ["a", "b"], "next": "page2"}])
+        generator = ListingGenerator(reddit, "dummy", limit=2, prefetch=True)
+        assert list(generator) == ["a", "b"]
+        assert len(reddit.params_seen) == 1
@@ -1,9 +1,13 @@
 import pickle
 
+import mock
 import pytest
 
 from praw.models import Subreddit, WikiPage
-from praw.models.reddit.subreddit import SubredditFlairTemplates
+from praw.models.reddit.subreddit import (
+    SubredditFlairTemplates,
+    SubredditModeration,
+)
 
 from ... import UnitTest
 
@@ -119,6 +123,22 @@ class TestSubredditFlair(UnitTest):
             )
 
 
+class TestSubredditModeration(UnitTest):
+    def test_chunk_fullnames(self):
+        fullnames = ["t3_{}".format(i) for i in range(250)]
+        chunks = list(SubredditModeration._chunk_fullnames(fullnames))
+        assert len(chunks) == 3
+        assert chunks[0] == ",".join(fullnames[:100])
+        assert chunks[2] == ",".join(fullnames[200:])
+
+    def test_submit_async(self):
+        subreddit = Subreddit(self.reddit, display_name="name")
+        thing = mock.Mock()
+        future = subreddit.mod.submit_async("remove", thing, spam=True)
+        assert future.result() is thing.mod.remove.return_value
+        thing.mod.remove.assert_called_once_with(spam=True)
+
+
 class TestSubredditFlairTemplates(UnitTest):
     def test_not_implemented(self):
         with pytest.raises(NotImplementedError):
@@ -9,6 +9,7 @@ from prawcore.exceptions import BadRequest
 from praw import Reddit, __version__
 from praw.config import Config
 from praw.exceptions import ClientException
+from praw.reddit import POOL_CONNECTIONS, POOL_MAXSIZE
 
 from . import UnitTest
 
@@ -71,6 +72,23 @@ class TestReddit(UnitTest):
     def test_multireddit(self):
         assert self.reddit.multireddit("bboe", "aa").path == "/user/bboe/m/aa"
 
+    def test_get_cached(self):
+        with mock.patch.object(
+            self.reddit, "get", return_value="response"
+        ) as mocked:
+            first = self.reddit._get_cached("dummy/path", {"limit": "1"})
+            second = self.reddit._get_cached("dummy/path", {"limit": "1"})
+            other = self.reddit._get_cached("dummy/path", {"limit": "2"})
+        assert first == second == other == "response"
+        assert mocked.call_count == 2
+
+    def test_pooled_adapter_mounted(self):
+        with Reddit(**self.REQUIRED_DUMMY_SETTINGS) as reddit:
+            session = reddit._core._requestor._http
+            adapter = session.get_adapter("https://oauth.reddit.com")
+            assert adapter._pool_connections == POOL_CONNECTIONS
+            assert adapter._pool_maxsize == POOL_MAXSIZE
+
     def test_read_only__with_authenticated_core(self):
         with Reddit(
             password=None,
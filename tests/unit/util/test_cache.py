@@ -1,10 +1,42 @@
 """Test praw.util.cache."""
 
-from praw.util.cache import cachedproperty
+from praw.util.cache import TTLCache, cachedproperty
 
 from .. import UnitTest
 
 
+class TestTTLCache(UnitTest):
+    def test_get__expired(self):
+        cache = TTLCache()
+        cache.set("key", "value", ttl=-1)
+        assert cache.get("key") is None
+
+    def test_get__missing(self):
+        assert TTLCache().get("key") is None
+
+    def test_get__unexpired(self):
+        cache = TTLCache()
+        cache.set("key", "value", ttl=60)
+        assert cache.get("key") == "value"
+
+    def test_set__evicts_oldest(self):
+        cache = TTLCache(maxsize=2)
+        cache.set("one", 1, ttl=60)
+        cache.set("two", 2, ttl=60)
+        cache.set("three", 3, ttl=60)
+        assert cache.get("one") is None
+        assert cache.get("two") == 2
+        assert cache.get("three") == 3
+
+    def test_set__overwrite_does_not_evict(self):
+        cache = TTLCache(maxsize=2)
+        cache.set("one", 1, ttl=60)
+        cache.set("two", 2, ttl=60)
+        cache.set("two", 22, ttl=60)
+        assert cache.get("one") == 1
+        assert cache.get("two") == 22
+
+
 class TestCachedProperty(UnitTest):
     class Klass:
         @cachedproperty